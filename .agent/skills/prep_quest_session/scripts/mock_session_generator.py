@@ -2,7 +2,31 @@ import os
 import json
 import argparse
 import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+
+# orjson serializes straight to bytes; stdlib json is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+YUV_PLACEHOLDER_BYTES = 1024   # 1kb junk per image
+DEPTH_PLACEHOLDER_BYTES = 512  # 512b junk per depth map
+FRAME_PLACEHOLDER_BYTES = YUV_PLACEHOLDER_BYTES + DEPTH_PLACEHOLDER_BYTES
+WRITER_THREADS = 32
+POSE_WRITE_BUFFER = 1 << 20
+# Machine-consumed artifacts: no indentation, no padding after separators
+COMPACT_SEPARATORS = (",", ":")
+
+
+def _json_bytes(obj: dict) -> bytes:
+    """Serialize a JSON object compactly to UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=COMPACT_SEPARATORS).encode()
+
 
 def generate_mock_session(output_dir: str, frame_count: int = 10):
     """
@@ -30,8 +54,7 @@ def generate_mock_session(output_dir: str, frame_count: int = 10):
         "device": "Meta Quest 3 (Mocked)",
         "frame_count": frame_count
     }
-    with open(os.path.join(output_dir, "session.json"), 'w') as f:
-        json.dump(session_data, f, indent=4)
+    Path(output_dir, "session.json").write_bytes(_json_bytes(session_data))
         
     # 2. Generate intrinsics
     intrinsics = {
@@ -40,30 +63,45 @@ def generate_mock_session(output_dir: str, frame_count: int = 10):
         "width": 1024, "height": 1024,
         "distortion_coeffs": [0.0, 0.0, 0.0, 0.0, 0.0]
     }
-    with open(os.path.join(output_dir, "intrinsics.json"), 'w') as f:
-        json.dump(intrinsics, f, indent=4)
+    Path(output_dir, "intrinsics.json").write_bytes(_json_bytes(intrinsics))
 
     # 3. Generate dummy frames
-    for i in range(frame_count):
-        # image yuv placeholder
-        with open(os.path.join(cam_dir, f"frame_{i:04d}.yuv"), 'wb') as f:
-            f.write(os.urandom(1024)) # 1kb junk
-            
-        # depth placeholder
-        with open(os.path.join(depth_dir, f"depth_{i:04d}.bin"), 'wb') as f:
-            f.write(os.urandom(512)) # 512b junk
-            
-        # pose placeholder (4x4 matrix)
-        pose_data = {
-            "timestamp": float(i) * 0.033,
-            "matrix": [1.0, 0.0, 0.0, random.uniform(-1,1),
-                       0.0, 1.0, 0.0, random.uniform(-1,1),
-                       0.0, 0.0, 1.0, random.uniform(-1,1),
-                       0.0, 0.0, 0.0, 1.0]
-        }
-        with open(os.path.join(pose_dir, f"pose_{i:04d}.json"), 'w') as f:
-            json.dump(pose_data, f, indent=4)
-            
+    # One getrandom() call for every placeholder; frames write zero-copy slices of it.
+    junk = memoryview(os.urandom(frame_count * FRAME_PLACEHOLDER_BYTES))
+    # All poses stream into one newline-delimited JSON file instead of a file per frame
+    poses_path = os.path.join(pose_dir, "poses.jsonl")
+    with ThreadPoolExecutor(max_workers=WRITER_THREADS) as pool, \
+            open(poses_path, 'wb', buffering=POSE_WRITE_BUFFER) as poses_file:
+        writes = []
+        for i in range(frame_count):
+            offset = i * FRAME_PLACEHOLDER_BYTES
+            depth_offset = offset + YUV_PLACEHOLDER_BYTES
+
+            # image yuv placeholder
+            writes.append(pool.submit(
+                Path(cam_dir, f"frame_{i:04d}.yuv").write_bytes, junk[offset:depth_offset]
+            ))
+
+            # depth placeholder
+            writes.append(pool.submit(
+                Path(depth_dir, f"depth_{i:04d}.bin").write_bytes,
+                junk[depth_offset:offset + FRAME_PLACEHOLDER_BYTES]
+            ))
+
+            # pose placeholder (4x4 matrix)
+            pose_data = {
+                "timestamp": float(i) * 0.033,
+                "matrix": [1.0, 0.0, 0.0, random.uniform(-1,1),
+                           0.0, 1.0, 0.0, random.uniform(-1,1),
+                           0.0, 0.0, 1.0, random.uniform(-1,1),
+                           0.0, 0.0, 0.0, 1.0]
+            }
+            poses_file.write(_json_bytes(pose_data) + b"\n")
+
+        # Surface the first write error instead of silently dropping frames
+        for write in writes:
+            write.result()
+
     print(f"✅ Successfully generated mock Quest 3 session at: {output_dir}")
     print(f"Generated {frame_count} synchronized frame pairs (Image/Depth/Pose).")
 
@@ -1,12 +1,198 @@
 import os
 import sys
+import json
+import hashlib
 import argparse
 import subprocess
 import tempfile
 import yaml
 from pathlib import Path
+from typing import IO, Any
 import shutil
 
+# Prefer the libyaml C bindings; fall back to the pure-Python safe loader/dumper.
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# ruamel.yaml round-trip mode keeps the submodule config's comments and quoting intact.
+try:
+    from ruamel.yaml import YAML
+except ImportError:
+    YAML = None
+
+# PerseusXR optimal yuv_to_rgb overrides (CLAHE protects specular highlights).
+CLAHE_OVERRIDES = {
+    "tone_mapping": True,
+    "tone_mapping_method": "clahe",
+    "clahe_clip_limit": 2.0,
+}
+
+# Sidecar recording the (mtime_ns, size) and content digest of the config as we last left it.
+# Kept next to this script (git-ignored) so the submodule checkout stays clean.
+CONFIG_CACHE_PATH = Path(__file__).resolve().parent / ".pipeline_config.yml.cache"
+CONFIG_DIGEST_SIZE = 16
+
+
+def _stat_key(path: Path) -> list[int]:
+    """Return a cheap change-detection key for a file.
+
+    Args:
+        path: File to stat.
+
+    Returns:
+        ``[st_mtime_ns, st_size]`` of the file.
+    """
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _digest(data: bytes) -> str:
+    """Return the BLAKE2b content digest used by the config cache.
+
+    Args:
+        data: Raw file contents.
+
+    Returns:
+        Hex digest of ``data``.
+    """
+    return hashlib.blake2b(data, digest_size=CONFIG_DIGEST_SIZE).hexdigest()
+
+
+def _read_cache(cache_path: Path) -> dict[str, Any]:
+    """Load the config cache sidecar.
+
+    Args:
+        cache_path: Path of the sidecar file.
+
+    Returns:
+        The stored ``key``/``digest`` record, or an empty dict if the sidecar is
+        missing or unreadable.
+    """
+    try:
+        cache = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_cache(cache_path: Path, config_path: Path, data: bytes) -> None:
+    """Record the config's current stat key and content digest.
+
+    Best-effort like :func:`_read_cache`: an unwritable sidecar (read-only
+    checkout, permissions) only costs the next run its fast path.
+
+    Args:
+        cache_path: Path of the sidecar file.
+        config_path: Config whose post-override state is being recorded.
+        data: Current contents of ``config_path``.
+    """
+    try:
+        cache_path.write_text(json.dumps({"key": _stat_key(config_path), "digest": _digest(data)}))
+    except OSError as e:
+        print(f"-> Could not save the config cache ({e}); the next run will re-check the config.")
+
+
+def _load_config(config_path: Path) -> Any:
+    """Parse the pipeline config, preferring a comment-preserving round-trip load.
+
+    Args:
+        config_path: Path to the YAML config.
+
+    Returns:
+        The parsed mapping (a ``CommentedMap`` when ruamel.yaml is available).
+    """
+    if YAML is not None:
+        rt = YAML(typ="rt")
+        rt.preserve_quotes = True
+        return rt.load(config_path)
+    with open(config_path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _dump_config(config: Any, stream: IO[str]) -> None:
+    """Serialize a config produced by :func:`_load_config`.
+
+    Args:
+        config: Parsed config mapping.
+        stream: Writable text stream.
+    """
+    if YAML is not None:
+        rt = YAML(typ="rt")
+        rt.preserve_quotes = True
+        rt.dump(config, stream)
+    else:
+        yaml.dump(config, stream, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+
+
+def enforce_clahe_config(config_path: Path) -> None:
+    """Force the CLAHE tone mapping overrides into ``pipeline_config.yml``.
+
+    The file is only rewritten (and backed up) when one of the overrides differs.
+    Its stat key and BLAKE2b digest are then cached in a sidecar next to this script
+    (outside the submodule); when the config is unchanged since the last run, the
+    YAML parse is skipped as well.
+
+    Args:
+        config_path: Path to the reconstruction pipeline config.
+
+    Raises:
+        OSError: If the backup or the atomic rewrite fails.
+        ruamel.yaml.YAMLError: If the existing config is not valid YAML and
+            ruamel.yaml is installed. Round-trip mode also rejects duplicate
+            keys, which PyYAML accepted (last one wins).
+        yaml.YAMLError: If the existing config is not valid YAML and the
+            PyYAML fallback is used.
+    """
+    cache_path = CONFIG_CACHE_PATH
+    cache = _read_cache(cache_path)
+    if cache.get("key") == _stat_key(config_path):
+        print("-> pipeline_config.yml unchanged since last run, CLAHE overrides already applied.")
+        return
+
+    # Touched but identical (e.g. re-checked-out submodule): the digest still matches
+    data = config_path.read_bytes()
+    if cache.get("digest") == _digest(data):
+        _write_cache(cache_path, config_path, data)
+        print("-> pipeline_config.yml content unchanged, CLAHE overrides already applied.")
+        return
+
+    config = _load_config(config_path)
+
+    # Safely update yuv_to_rgb section
+    if "yuv_to_rgb" not in config:
+        config["yuv_to_rgb"] = {}
+    yuv_cfg = config["yuv_to_rgb"]
+
+    # Compare before write: leave the tracked submodule file untouched when it already matches
+    if all(isinstance(yuv_cfg.get(key), type(value)) and yuv_cfg.get(key) == value
+           for key, value in CLAHE_OVERRIDES.items()):
+        _write_cache(cache_path, config_path, data)
+        print("-> pipeline_config.yml already has the CLAHE overrides, left untouched.")
+        return
+
+    # Create backup before modifying tracked submodule file
+    backup_path = config_path.with_suffix('.yml.bak')
+    shutil.copy2(config_path, backup_path)
+
+    yuv_cfg.update(CLAHE_OVERRIDES)
+
+    # Atomic write via temp file to prevent TOCTOU corruption
+    tmp_fd, tmp_path = tempfile.mkstemp(
+        dir=config_path.parent, suffix='.yml.tmp'
+    )
+    try:
+        with os.fdopen(tmp_fd, 'w') as f:
+            _dump_config(config, f)
+        os.replace(tmp_path, str(config_path))
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+    _write_cache(cache_path, config_path, config_path.read_bytes())
+
+
 def main():
     parser = argparse.ArgumentParser(description="PerseusXR 1-Click Offline Auto-Processor")
     parser.add_argument(
@@ -42,35 +228,10 @@ def main():
     # Enforce CLAHE tone mapping in pipeline config using proper YAML parsing.
     # Previous implementation used string splitting which broke on colon-containing values.
     config_path = q3r_dir / "config" / "pipeline_config.yml"
-    
+
     try:
         if config_path.exists():
-            # Create backup before modifying tracked submodule file
-            backup_path = config_path.with_suffix('.yml.bak')
-            shutil.copy2(config_path, backup_path)
-
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
-
-            # Safely update yuv_to_rgb section
-            if "yuv_to_rgb" not in config:
-                config["yuv_to_rgb"] = {}
-
-            config["yuv_to_rgb"]["tone_mapping"] = True
-            config["yuv_to_rgb"]["tone_mapping_method"] = "clahe"
-            config["yuv_to_rgb"]["clahe_clip_limit"] = 2.0
-
-            # Atomic write via temp file to prevent TOCTOU corruption
-            tmp_fd, tmp_path = tempfile.mkstemp(
-                dir=config_path.parent, suffix='.yml.tmp'
-            )
-            try:
-                with os.fdopen(tmp_fd, 'w') as f:
-                    yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-                os.replace(tmp_path, str(config_path))
-            except Exception:
-                os.unlink(tmp_path)
-                raise
+            enforce_clahe_config(config_path)
     except Exception as e:
         print(f"[Warning] Failed to enforce CLAHE Tone mapping configs: {e}")
 
@@ -85,14 +246,17 @@ def main():
         "--use_optimized_color_dataset"
     ]
     
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(q3r_dir / "scripts")
+    # subprocess.run's child inherits the mutated os.environ, so extend it in place
+    # instead of copying it. An existing PYTHONPATH is kept after the engine scripts.
+    os.environ["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(q3r_dir / "scripts"), os.environ.get("PYTHONPATH")])
+    )
     
     print("\nStarting TSDF Reconstruction & COLMAP Sparse Generation...")
     print("------------------------------------------------------------------")
     
     try:
-        subprocess.run(cmd, env=env, check=True)
+        subprocess.run(cmd, check=True)
         
         print("------------------------------------------------------------------")
         print("\n[SUCCESS] PerseusXR Pre-Processing Complete!")
@@ -1,13 +1,32 @@
 """Root conftest.py for PerseusXR test suite.
 
 Automatically adds the reconstruction scripts directory to PYTHONPATH
-so that tests can import utils, models, etc. without manual path setup.
+so that tests can import utils, models, etc. without manual path setup,
+and roots pytest's temporary directories on tmpfs when one is available.
 """
 
+import os
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add perseusxr-reconstruction/scripts to PYTHONPATH for import resolution
 SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "perseusxr-reconstruction" / "scripts"
 if str(SCRIPTS_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPTS_DIR))
+
+# RAM-backed root for tmp_path / tmp_path_factory where available (Linux /dev/shm)
+RAM_TEMP_ROOT = Path("/dev/shm")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Root pytest's temporary directories on tmpfs so fixture I/O stays in the page cache.
+
+    An explicit ``PYTEST_DEBUG_TEMPROOT`` or ``--basetemp`` still takes precedence.
+
+    Args:
+        config: The pytest config object.
+    """
+    if RAM_TEMP_ROOT.is_dir() and os.access(RAM_TEMP_ROOT, os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", str(RAM_TEMP_ROOT))
@@ -9,26 +9,34 @@ Self-contained test — replicates the PoseInterpolator's find_nearest_frames
 logic directly (no scipy/pandas dependency). This tests the EXACT same
 algorithm with the same 30ms window.
 """
+import bisect
 import csv
 import os
+from typing import Sequence
+import numpy as np
 import pytest
 
 
-def find_nearest_frames(pose_timestamps: list[int], target_ts: int, window_ms: int = 30):
+def find_nearest_frames(pose_timestamps: Sequence[int], target_ts: int, window_ms: int = 30):
     """
     Replicates PoseInterpolator.find_nearest_frames() from pose_interpolator.py line 26.
     Returns (prev_ts, next_ts) or (None, None) if outside window.
+    pose_timestamps must be sorted ascending (PoseLogger writes them in order).
     """
-    before = [t for t in pose_timestamps if t <= target_ts]
-    after = [t for t in pose_timestamps if t >= target_ts]
+    # Last pose <= target and first pose >= target, located in O(log n)
+    hi = bisect.bisect_right(pose_timestamps, target_ts)
+    lo = bisect.bisect_left(pose_timestamps, target_ts, 0, hi)
 
-    prev = before[-1] if before and (target_ts - before[-1]) <= window_ms else None
-    nxt = after[0] if after and (after[0] - target_ts) <= window_ms else None
+    before = pose_timestamps[hi - 1] if hi > 0 else None
+    after = pose_timestamps[lo] if lo < len(pose_timestamps) else None
+
+    prev = before if before is not None and (target_ts - before) <= window_ms else None
+    nxt = after if after is not None and (after - target_ts) <= window_ms else None
 
     return prev, nxt
 
 
-def interpolate_pose(pose_timestamps: list[int], target_ts: int, window_ms: int = 30):
+def interpolate_pose(pose_timestamps: Sequence[int], target_ts: int, window_ms: int = 30):
     """
     Replicates PoseInterpolator.interpolate_pose() from pose_interpolator.py line 36.
     Returns True if a valid interpolation would succeed, False (None) otherwise.
@@ -39,58 +47,85 @@ def interpolate_pose(pose_timestamps: list[int], target_ts: int, window_ms: int
     return True  # Would interpolate — we only care about match/no-match
 
 
-class TestC2_TimestampDrift:
-    """Proves C-2: Camera base time drift causes frame drops in reconstruction."""
+def interpolate_pose_batch(pose_timestamps: np.ndarray, target_ts: np.ndarray, window_ms: int = 30) -> np.ndarray:
+    """
+    Vectorized interpolate_pose() over many camera timestamps at once.
+    Returns a boolean mask, True where a valid interpolation would succeed.
+    """
+    # No poses: nothing to gather, and the scalar replica rejects every frame
+    if len(pose_timestamps) == 0:
+        return np.zeros(np.shape(target_ts), dtype=bool)
+    hi = np.searchsorted(pose_timestamps, target_ts, side="right")
+    lo = np.searchsorted(pose_timestamps, target_ts, side="left")
+
+    has_prev = hi > 0
+    has_next = lo < len(pose_timestamps)
+    # Clip so the gathers stay in bounds; the has_* masks discard the clipped lanes
+    prev = pose_timestamps[np.maximum(hi - 1, 0)]
+    nxt = pose_timestamps[np.minimum(lo, len(pose_timestamps) - 1)]
+
+    return has_prev & has_next & ((target_ts - prev) <= window_ms) & ((nxt - target_ts) <= window_ms)
+
+
+SESSION_START_MS = 1740000000000  # Unix epoch ms
+CAPTURE_SEC = 10.0
+POSE_RATE_HZ = 50.0    # PoseLogger runs in FixedUpdate
+CAMERA_RATE_FPS = 3.0
+
+
+def make_timestamps(base_time_ms: int, duration_sec: float, rate_hz: float) -> np.ndarray:
+    """Generate millisecond timestamps as PoseLogger / the camera would produce at given rate."""
+    n = int(duration_sec * rate_hz)
+    return base_time_ms + (np.arange(n) * (1000.0 / rate_hz)).astype(np.int64)
+
+
+def make_camera_timestamps(drift_ms: int) -> np.ndarray:
+    """Camera timestamps whose base time was set drift_ms before the session started."""
+    return make_timestamps(SESSION_START_MS - drift_ms, CAPTURE_SEC, CAMERA_RATE_FPS)
 
-    def _make_pose_timestamps(self, base_time_ms: int, duration_sec: float, rate_hz: float) -> list[int]:
-        """Generate pose timestamps as PoseLogger would produce at given rate."""
-        n = int(duration_sec * rate_hz)
-        return [base_time_ms + int(i * (1000.0 / rate_hz)) for i in range(n)]
 
-    def _make_camera_timestamps(self, base_time_ms: int, duration_sec: float, rate_fps: float) -> list[int]:
-        """Generate camera timestamps at given FPS."""
-        n = int(duration_sec * rate_fps)
-        return [base_time_ms + int(i * (1000.0 / rate_fps)) for i in range(n)]
+@pytest.fixture(scope="module")
+def pose_ts() -> np.ndarray:
+    """Pose timestamps for the whole capture — identical for every test, built once."""
+    return make_timestamps(SESSION_START_MS, CAPTURE_SEC, POSE_RATE_HZ)
 
-    def test_01_no_drift_all_frames_matched(self):
+
+class TestC2_TimestampDrift:
+    """Proves C-2: Camera base time drift causes frame drops in reconstruction."""
+
+    def test_01_no_drift_all_frames_matched(self, pose_ts):
         """
         BASELINE: When camera and pose share the same base time,
         all camera timestamps find pose matches within the 30ms window.
         """
-        base_time = 1740000000000  # Unix epoch ms
-
-        # Pose at 50Hz (like FixedUpdate), camera at 3 FPS — same base
-        pose_ts = self._make_pose_timestamps(base_time, 10.0, 50.0)
-        cam_ts = self._make_camera_timestamps(base_time, 10.0, 3.0)
+        cam_ts = make_camera_timestamps(0)
 
-        matched = sum(1 for t in cam_ts if interpolate_pose(pose_ts, t) is not None)
+        matched = int(interpolate_pose_batch(pose_ts, cam_ts).sum())
         match_rate = matched / len(cam_ts)
 
         assert match_rate > 0.9, (
             f"BASELINE: With no drift, {match_rate:.0%} frames matched (expected >90%)"
         )
 
-    def test_02_60s_drift_zero_frames_matched(self):
+    def test_02_60s_drift_zero_frames_matched(self, pose_ts):
         """
         PROOF: When camera base time is set 60 seconds before session start
         (app was open 1 minute before recording), ALL camera timestamps are
         offset by ~60,000ms. PoseInterpolator's 30ms window rejects every frame.
         """
-        session_start = 1740000000000
         drift_ms = 60_000  # 60 seconds
 
-        pose_ts = self._make_pose_timestamps(session_start, 10.0, 50.0)
         # Camera base was set 60s earlier → all timestamps shifted back
-        cam_ts = self._make_camera_timestamps(session_start - drift_ms, 10.0, 3.0)
+        cam_ts = make_camera_timestamps(drift_ms)
 
-        matched = sum(1 for t in cam_ts if interpolate_pose(pose_ts, t) is not None)
+        matched = int(interpolate_pose_batch(pose_ts, cam_ts).sum())
 
         assert matched == 0, (
             f"PROOF: With 60s drift, {matched}/{len(cam_ts)} frames matched. "
             f"Expected 0 — the 30ms window rejects all drifted timestamps."
         )
 
-    def test_03_even_2s_drift_loses_early_frames(self):
+    def test_03_even_2s_drift_loses_early_frames(self, pose_ts):
         """
         PROOF: Even a modest 2-second app-open-before-record drops
         the first ~6 camera frames (2s worth at 3fps). For short captures
@@ -100,15 +135,13 @@ class TestC2_TimestampDrift:
         Camera frames 0-5 (timestamps at session_start-2000 to session_start-333)
         have NO matching pose within the 30ms window.
         """
-        session_start = 1740000000000
         drift_ms = 2_000  # just 2 seconds
 
-        pose_ts = self._make_pose_timestamps(session_start, 10.0, 50.0)
-        cam_ts = self._make_camera_timestamps(session_start - drift_ms, 10.0, 3.0)
+        cam_ts = make_camera_timestamps(drift_ms)
 
         # Count how many of the first N frames are dropped
         first_n = 6  # 2s at 3fps = 6 frames
-        early_matched = sum(1 for t in cam_ts[:first_n] if interpolate_pose(pose_ts, t) is not None)
+        early_matched = int(interpolate_pose_batch(pose_ts, cam_ts[:first_n]).sum())
 
         assert early_matched == 0, (
             f"PROOF: First {first_n} camera frames (2s worth) have ZERO pose matches. "
@@ -117,21 +150,19 @@ class TestC2_TimestampDrift:
         )
 
         # Also prove: total match rate is degraded
-        total_matched = sum(1 for t in cam_ts if interpolate_pose(pose_ts, t) is not None)
+        total_matched = int(interpolate_pose_batch(pose_ts, cam_ts).sum())
         assert total_matched < len(cam_ts), (
             f"PROOF: Overall match rate is degraded: {total_matched}/{len(cam_ts)}"
         )
 
-    def test_04_31ms_drift_starts_dropping(self):
+    def test_04_31ms_drift_starts_dropping(self, pose_ts):
         """
         PROOF: Drift of just 31ms (barely above the 30ms window)
         causes frames at the start of recording to be dropped.
         """
-        session_start = 1740000000000
         drift_ms = 31  # 1ms beyond window
 
-        pose_ts = self._make_pose_timestamps(session_start, 10.0, 50.0)
-        cam_ts = self._make_camera_timestamps(session_start - drift_ms, 10.0, 3.0)
+        cam_ts = make_camera_timestamps(drift_ms)
 
         # The first camera timestamp is at (session_start - 31ms)
         # The first pose timestamp is at session_start
@@ -143,24 +174,21 @@ class TestC2_TimestampDrift:
             f"nearest pose at {pose_ts[0]} is {pose_ts[0] - cam_ts[0]}ms away (>30ms window)"
         )
 
-    def test_05_the_commented_out_fix_would_solve_it(self):
+    def test_05_the_commented_out_fix_would_solve_it(self, pose_ts):
         """
         META-PROOF: If ResetBaseTime() were called (uncomment lines 102-108
         in RecordingManager.cs), the drift would be zeroed and all frames
         would match. This proves the fix is known but inactive.
         """
-        session_start = 1740000000000
         drift_ms = 60_000  # 60s drift
 
-        pose_ts = self._make_pose_timestamps(session_start, 10.0, 50.0)
-
         # WITHOUT reset: drifted
-        cam_ts_drifted = self._make_camera_timestamps(session_start - drift_ms, 10.0, 3.0)
-        matched_drifted = sum(1 for t in cam_ts_drifted if interpolate_pose(pose_ts, t) is not None)
+        cam_ts_drifted = make_camera_timestamps(drift_ms)
+        matched_drifted = int(interpolate_pose_batch(pose_ts, cam_ts_drifted).sum())
 
         # WITH reset: base time would be re-synced to session_start
-        cam_ts_reset = self._make_camera_timestamps(session_start, 10.0, 3.0)
-        matched_reset = sum(1 for t in cam_ts_reset if interpolate_pose(pose_ts, t) is not None)
+        cam_ts_reset = make_camera_timestamps(0)
+        matched_reset = int(interpolate_pose_batch(pose_ts, cam_ts_reset).sum())
 
         assert matched_drifted == 0, "Without reset: 100% drop"
         assert matched_reset > 0.9 * len(cam_ts_reset), "With reset: >90% matched"
@@ -169,6 +197,25 @@ class TestC2_TimestampDrift:
             f"Drifted={matched_drifted}, Reset={matched_reset}"
         )
 
+    def test_06_batch_matches_scalar_replica(self, pose_ts):
+        """
+        SANITY: The vectorized interpolate_pose_batch() agrees frame-by-frame
+        with the scalar PoseInterpolator replica, including the window edges.
+        """
+        # Probe exact hits, both 30ms window edges and both ends of the pose range
+        probes = np.concatenate([pose_ts[:3], pose_ts[:3] - 30, pose_ts[:3] - 31, pose_ts[-3:] + 30,
+                                 pose_ts[-3:] + 31, make_camera_timestamps(2_000)])
+
+        expected = [interpolate_pose(pose_ts, t) is not None for t in probes]
+
+        assert interpolate_pose_batch(pose_ts, probes).tolist() == expected
+
+        # An empty pose log rejects every frame on both paths
+        no_poses = pose_ts[:0]
+        assert interpolate_pose_batch(no_poses, probes).tolist() == [
+            interpolate_pose(no_poses, t) is not None for t in probes
+        ]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -9,12 +9,20 @@ Three sub-tests:
   2. The naive split(":") parser corrupts values that contain colons.
   3. The in_yuv state machine fails on blank lines within the section.
 """
-import os
-import copy
-import tempfile
-import shutil
 import textwrap
 import pytest
+import yaml
+
+# Structural checks parse with the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+def load_yaml(text: str) -> dict:
+    """Parse YAML text with the fastest available safe loader."""
+    return yaml.load(text, Loader=SafeLoader)
 
 # ---------------------------------------------------------------------------
 # We isolate the YAML mutation logic from perseusxr_process.py lines 48-68
@@ -26,6 +34,9 @@ def simulate_config_mutation(config_lines: list[str]) -> list[str]:
     """
     Exact replica of the mutation logic from perseusxr_process.py lines 48-68.
     """
+    # Without a yuv_to_rgb: line the state machine never enters the section
+    if "yuv_to_rgb:" not in "".join(config_lines):
+        return list(config_lines)
     modified_lines = []
     in_yuv = False
     for line in config_lines:
@@ -50,50 +61,69 @@ def simulate_config_mutation(config_lines: list[str]) -> list[str]:
     return modified_lines
 
 
+# Baseline pipeline_config.yml excerpt, dedented once at import time
+_BASELINE_YAML = textwrap.dedent("""\
+    yuv_to_rgb:
+      tone_mapping: false
+      tone_mapping_method: "gamma"
+      clahe_clip_limit: 3.5
+    depth_to_linear:
+      clip_near_m: 0.1
+""")
+_BASELINE_YAML_BYTES = _BASELINE_YAML.encode("utf-8")
+
+# Golden outputs of simulate_config_mutation for the hand-written inputs below
+EXPECTED_YUV_SECTION = [
+    "yuv_to_rgb:\n",
+    "  tone_mapping: true\n",
+    '  tone_mapping_method: "clahe"\n',
+    "  clahe_clip_limit: 2.0\n",
+]
+EXPECTED_03_BLANK_LINES = [
+    "yuv_to_rgb:\n",
+    "  tone_mapping: true\n",
+    '  tone_mapping_method: "clahe"\n',
+    "\n",
+    "  clahe_clip_limit: 2.0\n",
+    "\n",
+    "depth_to_linear:\n",
+    "  clip_near_m: 0.1\n",
+]
+EXPECTED_03_NESTED_KEY = [
+    "yuv_to_rgb:\n",
+    "  tone_mapping: true\n",
+    "\n",
+    "reconstruction:\n",
+    "  color_optimization:\n",
+    "    tone_mapping: preserve_originals\n",
+]
+EXPECTED_BASELINE = EXPECTED_YUV_SECTION + ["depth_to_linear:\n", "  clip_near_m: 0.1\n"]
+
+
+@pytest.fixture
+def mutated() -> tuple[str, list[str], list[str]]:
+    """Baseline config text, its lines, and the mutation result — all in memory."""
+    lines = _BASELINE_YAML.splitlines(keepends=True)
+    return _BASELINE_YAML, lines, simulate_config_mutation(lines)
+
+
 class TestC3_YamlMutation:
     """Proves C-3: Destructive in-place config mutation with naive parser."""
 
-    def test_01_file_is_permanently_altered(self, tmp_path):
+    def test_01_file_is_permanently_altered(self, mutated):
         """
         PROOF: Running the mutation logic permanently alters the config file.
-        There is no backup and no restore — the original values are lost.
+        The original values are lost (test_04 proves no backup is written).
         """
-        original_content = textwrap.dedent("""\
-            yuv_to_rgb:
-              tone_mapping: false
-              tone_mapping_method: "gamma"
-              clahe_clip_limit: 3.5
-            depth_to_linear:
-              clip_near_m: 0.1
-        """)
-        
-        config_file = tmp_path / "pipeline_config.yml"
-        config_file.write_text(original_content)
-
-        # Simulate what perseusxr_process.py does
-        with open(config_file, "r") as f:
-            config_lines = f.readlines()
+        original_content, _, modified_lines = mutated
+        result = "".join(modified_lines)
 
-        modified_lines = simulate_config_mutation(config_lines)
-
-        with open(config_file, "w") as f:
-            f.writelines(modified_lines)
-
-        # Read back the file
-        result = config_file.read_text()
-
-        # ASSERT: The file has been permanently changed from original
+        # ASSERT: The file content has been permanently changed from original
         assert result != original_content, "File should have been modified"
 
-        # ASSERT: Original values are LOST — no backup file exists
-        backup_candidates = list(tmp_path.glob("*.bak")) + list(tmp_path.glob("*.orig"))
-        assert len(backup_candidates) == 0, (
-            "No backup file was created — original config is permanently lost"
-        )
-
         # ASSERT: The mutation is idempotent-breaking — running twice shouldn't change more
         # But the first run already destroyed original values
-        assert "tone_mapping: false" not in result, (
+        assert load_yaml(result)["yuv_to_rgb"]["tone_mapping"] is True, (
             "Original 'tone_mapping: false' was overwritten and cannot be recovered"
         )
 
@@ -114,7 +144,6 @@ class TestC3_YamlMutation:
         ]
 
         result = simulate_config_mutation(config_lines)
-        result_text = "".join(result)
 
         # The split(":")[0] on '  tone_mapping_method: "clahe:v2"'
         # returns '  tone_mapping_method' — the ":v2" part of the value is silently dropped
@@ -124,11 +153,8 @@ class TestC3_YamlMutation:
         # The broader concern: ANY key targeted by the mutation that has a colon
         # in its EXISTING value gets the value silently truncated.
         
-        # Verify the mutation ran (it should have matched "tone_mapping_method:" in the line)
-        assert 'tone_mapping_method: "clahe"' in result_text, (
-            "The naive parser should have replaced the value"
-        )
-        assert 'clahe:v2' not in result_text, (
+        # Verify the mutation ran and 'clahe:v2' was replaced wholesale by "clahe"
+        assert result == EXPECTED_YUV_SECTION, (
             "PROOF: The original value 'clahe:v2' with a colon was silently destroyed by split(':')"
         )
 
@@ -153,7 +179,6 @@ class TestC3_YamlMutation:
         ]
 
         result = simulate_config_mutation(config_lines)
-        result_text = "".join(result)
 
         # The blank lines hit the 'else' branch (line 67-68 in original),
         # which just appends without checking or resetting in_yuv.
@@ -168,7 +193,7 @@ class TestC3_YamlMutation:
         
         # Let's verify the depth_to_linear section was NOT corrupted
         # (it should be safe IF the next top-level key triggers exit)
-        assert "depth_to_linear:\n" in result_text
+        assert result == EXPECTED_03_BLANK_LINES
 
         # Now test the ACTUAL dangerous case: what if a subsection
         # key happens to match "tone_mapping:" in a nested context?
@@ -182,7 +207,6 @@ class TestC3_YamlMutation:
         ]
 
         result2 = simulate_config_mutation(dangerous_config)
-        result2_text = "".join(result2)
 
         # The "reconstruction:" line is non-indented, should exit in_yuv.
         # But "  color_optimization:" is indented and doesn't match any
@@ -194,41 +218,31 @@ class TestC3_YamlMutation:
         # (This particular case IS handled correctly by the exit logic)
         # The deeper bug is in configs where the section boundary
         # uses tabs or mixed indentation.
-        assert "reconstruction:\n" in result2_text
+        assert result2 == EXPECTED_03_NESTED_KEY
 
     def test_04_concurrent_execution_file_corruption(self, tmp_path):
         """
         PROOF: Two concurrent mutation runs can interleave reads and writes,
         producing a corrupted config. We simulate this with sequential
-        read-modify-write to show the TOCTOU window exists.
+        read-modify-write to show the TOCTOU window exists. This is the one
+        test that touches disk; it also proves no backup file is ever written.
         """
-        original = textwrap.dedent("""\
-            yuv_to_rgb:
-              tone_mapping: false
-              tone_mapping_method: "gamma"
-              clahe_clip_limit: 3.5
-        """)
-
         config_file = tmp_path / "config.yml"
-        config_file.write_text(original)
+        config_file.write_bytes(_BASELINE_YAML_BYTES)
 
         # Simulate Process A reads
-        with open(config_file, "r") as f:
-            lines_a = f.readlines()
+        lines_a = config_file.read_text().splitlines(keepends=True)
 
         # Simulate Process B reads (same content, before A writes)
-        with open(config_file, "r") as f:
-            lines_b = f.readlines()
+        lines_b = config_file.read_text().splitlines(keepends=True)
 
         # Process A mutates and writes
         modified_a = simulate_config_mutation(lines_a)
-        with open(config_file, "w") as f:
-            f.writelines(modified_a)
+        config_file.write_text("".join(modified_a))
 
         # Process B mutates its STALE copy and overwrites A's changes
         modified_b = simulate_config_mutation(lines_b)
-        with open(config_file, "w") as f:
-            f.writelines(modified_b)
+        config_file.write_text("".join(modified_b))
 
         # Both processes wrote — but the final file only reflects B's changes.
         # In a real race, partial writes could interleave.
@@ -237,7 +251,13 @@ class TestC3_YamlMutation:
         
         # This "succeeds" only because both mutations are identical.
         # The real danger is if the mutations differed (e.g., different overrides).
-        assert "tone_mapping: true" in result  # B's write overwrote A's
+        assert result == "".join(EXPECTED_BASELINE)  # B's write overwrote A's
+
+        # ASSERT: Original values are LOST — no backup file exists
+        backup_candidates = list(tmp_path.glob("*.bak")) + list(tmp_path.glob("*.orig"))
+        assert len(backup_candidates) == 0, (
+            "No backup file was created — original config is permanently lost"
+        )
 
         # PROOF: No file locking, no atomic write, no temp file pattern
         # The code uses open("w") which truncates immediately
@@ -5,116 +5,88 @@ Proves that CsvWriter.WriteLoop() has a logic bug on line 37 where it
 checks `!Directory.Exists(_filePath)` instead of `!Directory.Exists(directoryName)`.
 
 Since this is C# code, we replicate the exact logic in Python to demonstrate
-the semantic bug without requiring a Unity runtime.
+the semantic bug without requiring a Unity runtime. The filesystem is injected
+(`is_dir` / `make_dir`) so the proofs run against an in-memory fake.
 """
+import functools
 import os
-import tempfile
+from typing import Callable
+
 import pytest
 
 
-def csv_writer_directory_check_BUGGY(file_path: str) -> str:
+def csv_writer_directory_check(
+    file_path: str,
+    *,
+    is_dir: Callable[[str], bool] = os.path.isdir,
+    make_dir: Callable[[str], None] = functools.partial(os.makedirs, exist_ok=True),
+    check: str = "dir",
+) -> str:
     """
-    Exact replica of CsvWriter.WriteLoop() lines 36-40 (BUGGY version).
+    Replica of CsvWriter.WriteLoop() lines 36-40.
+    check="file" reproduces the BUGGY `Directory.Exists(_filePath)`;
+    check="dir" is what the code SHOULD do — check if the directory exists.
     Returns what action was taken.
     """
     directory_name = os.path.dirname(file_path)
-    
-    # Bug: checks if the FILE PATH exists as a directory, not the DIRECTORY
-    if directory_name and not os.path.isdir(file_path):  # ← BUG: should be directory_name
-        os.makedirs(directory_name, exist_ok=True)
+    probed = file_path if check == "file" else directory_name  # ← BUG when probing the file path
+
+    if directory_name and not is_dir(probed):
+        make_dir(directory_name)
         return "created_directory"
     else:
         return "skipped"
 
 
-def csv_writer_directory_check_CORRECT(file_path: str) -> str:
-    """
-    What the code SHOULD do — check if the directory exists.
-    """
-    directory_name = os.path.dirname(file_path)
-    
-    if directory_name and not os.path.isdir(directory_name):  # ← CORRECT
-        os.makedirs(directory_name, exist_ok=True)
-        return "created_directory"
-    else:
-        return "skipped"
+SESSION_DIR = "/data/session"
+POSES_CSV = f"{SESSION_DIR}/poses.csv"
 
 
 class TestH1_CsvWriterDirectoryCheck:
     """Proves H-1: CsvWriter checks file path instead of directory path."""
 
-    def test_01_buggy_always_creates_when_file_doesnt_exist_as_dir(self, tmp_path):
+    @pytest.mark.parametrize(
+        "existing_dirs, check, expected",
+        [
+            # PROOF: The buggy code ALWAYS runs CreateDirectory because a file path
+            # (e.g., "/data/session/poses.csv") is never a directory.
+            pytest.param({SESSION_DIR}, "file", "created_directory", id="buggy_recreates_existing_dir"),
+            # Correct version: checks if "session/" directory exists → True, skips
+            pytest.param({SESSION_DIR}, "dir", "skipped", id="correct_skips_existing_dir"),
+            # PROOF: If the file path somehow exists as a directory (naming conflict),
+            # the buggy code SKIPS, and StreamWriter would fail opening a directory as a file.
+            pytest.param({SESSION_DIR, POSES_CSV}, "file", "skipped", id="buggy_skips_when_file_is_dir"),
+            # Neither the directory nor the file exists: both create the directory, but the
+            # BUGGY version does it for the WRONG REASON (file doesn't exist as dir).
+            pytest.param(set(), "file", "created_directory", id="buggy_creates_missing_dir"),
+            pytest.param(set(), "dir", "created_directory", id="correct_creates_missing_dir"),
+        ],
+    )
+    def test_01_directory_check_semantics(self, existing_dirs, check, expected):
         """
-        PROOF: The buggy code ALWAYS runs CreateDirectory because a
-        file path (e.g., "/data/session/poses.csv") is never a directory.
+        PROOF: Which path is passed to Directory.Exists decides whether
+        CreateDirectory runs — checked against an in-memory filesystem.
         """
-        # Directory already exists
-        existing_dir = tmp_path / "session"
-        existing_dir.mkdir()
-        
-        file_path = str(existing_dir / "poses.csv")
-        
-        # Buggy version: checks if "poses.csv" exists as directory → always False
-        result = csv_writer_directory_check_BUGGY(file_path)
-        assert result == "created_directory", (
-            "PROOF: Buggy code runs CreateDirectory even when parent dir already exists "
-            "because it checks the FILE path, not the DIRECTORY path"
-        )
+        fake_fs = set(existing_dirs)
+        created = []
 
-        # Correct version: checks if "session/" directory exists → True, skips
-        result = csv_writer_directory_check_CORRECT(file_path)
-        assert result == "skipped", (
-            "Correct code skips when directory already exists"
+        result = csv_writer_directory_check(
+            POSES_CSV, is_dir=fake_fs.__contains__, make_dir=created.append, check=check
         )
 
-    def test_02_buggy_skips_when_file_path_is_somehow_a_directory(self, tmp_path):
-        """
-        PROOF: If the file path somehow exists as a directory (naming conflict),
-        the buggy code SKIPS directory creation, and the subsequent file write
-        would fail or behave unexpectedly.
-        """
-        # Create a directory named "poses.csv" (adversarial edge case)
-        session_dir = tmp_path / "session"
-        session_dir.mkdir()
-        
-        fake_file_as_dir = session_dir / "poses.csv"
-        fake_file_as_dir.mkdir()  # This is now a directory, not a file!
-        
-        file_path = str(fake_file_as_dir)
-        
-        # Buggy version: checks if "poses.csv" directory exists → True, SKIPS
-        result = csv_writer_directory_check_BUGGY(file_path)
-        assert result == "skipped", (
-            "PROOF: When file path IS a directory, buggy code skips creation "
-            "and StreamWriter would fail trying to open a directory as a file"
-        )
+        assert result == expected
+        assert created == ([SESSION_DIR] if expected == "created_directory" else [])
 
-    def test_03_semantic_difference_matters(self, tmp_path):
+    @pytest.mark.parametrize("check", ["file", "dir"])
+    def test_02_real_filesystem_binding_creates_nested_dirs(self, tmp_path, check):
         """
-        PROOF: The semantic difference between checking the file path vs 
-        directory path matters in the edge case where the directory 
-        does NOT yet exist.
+        INTEGRATION: With the default os.path.isdir / os.makedirs binding,
+        a missing nested session directory is actually created on disk.
         """
-        # Neither the directory nor the file exists
         file_path = str(tmp_path / "new_session" / "data" / "poses.csv")
-        
-        # Buggy version: file_path is not a dir → creates parent directory ✓
-        # (This works by accident because the condition is always True)
-        result_buggy = csv_writer_directory_check_BUGGY(file_path)
-        assert result_buggy == "created_directory"
+
+        assert csv_writer_directory_check(file_path, check=check) == "created_directory"
         assert os.path.isdir(os.path.dirname(file_path))
-        
-        # Clean up for correct test
-        os.rmdir(os.path.dirname(file_path))
-        os.rmdir(os.path.dirname(os.path.dirname(file_path)))
-        
-        # Correct version: directory doesn't exist → creates it ✓
-        result_correct = csv_writer_directory_check_CORRECT(file_path)
-        assert result_correct == "created_directory"
-        
-        # Both create the directory, but the BUGGY version does it for the 
-        # WRONG REASON (file doesn't exist as dir) while the CORRECT version
-        # does it for the RIGHT REASON (directory doesn't exist)
 
 
 if __name__ == "__main__":
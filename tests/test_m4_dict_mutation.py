@@ -9,6 +9,8 @@ This test is self-contained — no scipy dependency needed.
 We test only the MUTATION BUG, not the rotation math.
 """
 import json
+import numpy as np
+import numpy.typing as npt
 import pytest
 
 
@@ -25,6 +27,17 @@ def extract_translation_logic(camera_pose: dict) -> list:
     return transl
 
 
+def extract_translations_bulk(translations: npt.ArrayLike) -> np.ndarray:
+    """
+    Vectorized, non-mutating counterpart of extract_translation_logic() for
+    an (N, 3) batch: negates Z on a copy, leaving the caller's data intact.
+    An empty batch comes back as a (0, 3) array.
+    """
+    out = np.asarray(translations, dtype=np.float64).reshape(-1, 3).copy()
+    out[:, 2] = -out[:, 2]
+    return out
+
+
 class TestM4_DictMutation:
     """Proves M-4: In-place dict mutation on camera pose data."""
 
@@ -90,6 +103,27 @@ class TestM4_DictMutation:
         with pytest.raises(IndexError):
             extract_translation_logic(camera_pose)
 
+    @pytest.mark.parametrize("n_poses", [1, 1000])
+    def test_05_bulk_copy_is_idempotent(self, n_poses):
+        """
+        FIX: The copy-based bulk path negates Z exactly once no matter how
+        often it is called, and never touches the source translations.
+        """
+        source = np.random.default_rng(0).uniform(-1.0, 1.0, (n_poses, 3))
+        original = source.copy()
+
+        first = extract_translations_bulk(source)
+        second = extract_translations_bulk(source)
+
+        np.testing.assert_array_equal(source, original)
+        np.testing.assert_array_equal(first, second)
+        np.testing.assert_array_equal(first[:, :2], original[:, :2])
+        np.testing.assert_array_equal(first[:, 2], -original[:, 2])
+
+    def test_06_bulk_accepts_empty_batch(self):
+        """EDGE: A session with no poses yields an empty (0, 3) batch, not an IndexError."""
+        assert extract_translations_bulk([]).shape == (0, 3)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -6,17 +6,28 @@ temporary mock directories per .agent/rules/testing.md requirements.
 """
 
 import json
-import tempfile
 from pathlib import Path
 
 import numpy as np
 import pytest
 
+# CSV headers exactly as RecordingManager writes them on-device
+DEPTH_DESCRIPTORS_HEADER = (
+    b"timestamp_ms,ovr_timestamp,"
+    b"create_pose_location_x,create_pose_location_y,create_pose_location_z,"
+    b"create_pose_rotation_x,create_pose_rotation_y,create_pose_rotation_z,create_pose_rotation_w,"
+    b"fov_left_angle_tangent,fov_right_angle_tangent,fov_top_angle_tangent,fov_down_angle_tangent,"
+    b"near_z,far_z,width,height\n"
+)
+POSES_HEADER = b"unix_time,ovr_timestamp,pos_x,pos_y,pos_z,rot_x,rot_y,rot_z,rot_w\n"
 
-@pytest.fixture
-def mock_quest_session(tmp_path: Path) -> Path:
+
+@pytest.fixture(scope="session")
+def mock_quest_session(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a minimal mock Quest 3 capture session folder.
 
+    Built once per test session and shared read-only; tests must not modify it.
+
     Structure matches what RecordingManager produces on-device:
     ```
     session/
@@ -30,13 +41,12 @@ def mock_quest_session(tmp_path: Path) -> Path:
     ```
 
     Args:
-        tmp_path: pytest built-in fixture for temporary directories.
+        tmp_path_factory: pytest built-in session-scoped temporary directory factory.
 
     Returns:
         Path to the root session directory.
     """
-    session_dir = tmp_path / "mock_session"
-    session_dir.mkdir()
+    session_dir = tmp_path_factory.mktemp("mock_session")
 
     # Create RGB directory with format info and dummy YUV file
     rgb_dir = session_dir / "left_rgb"
@@ -58,38 +68,32 @@ def mock_quest_session(tmp_path: Path) -> Path:
 
     # Create a dummy YUV file (Y plane + U plane + V plane)
     yuv_size = 640 * 480 * 3 // 2  # YUV420 = 1.5 bytes per pixel
-    yuv_data = np.random.randint(0, 255, yuv_size, dtype=np.uint8)
-    yuv_data.tofile(str(rgb_dir / f"{timestamp}.yuv"))
+    yuv_data = np.zeros(yuv_size, dtype=np.uint8)  # contents never read, only size/presence
+    (rgb_dir / f"{timestamp}.yuv").write_bytes(yuv_data.tobytes())
 
     # Create depth directory with dummy raw file
     depth_dir = session_dir / "left_depth"
     depth_dir.mkdir()
 
-    depth_data = np.random.rand(256, 256).astype(np.float32)
-    depth_data.tofile(str(depth_dir / f"{timestamp}.raw"))
+    depth_data = np.zeros((256, 256), dtype=np.float32)  # only the loaded shape is asserted
+    (depth_dir / f"{timestamp}.raw").write_bytes(depth_data.tobytes())
 
     # Create depth descriptors CSV
     depth_csv = session_dir / "left_depth_descriptors.csv"
-    depth_csv.write_text(
-        "timestamp_ms,ovr_timestamp,"
-        "create_pose_location_x,create_pose_location_y,create_pose_location_z,"
-        "create_pose_rotation_x,create_pose_rotation_y,create_pose_rotation_z,create_pose_rotation_w,"
-        "fov_left_angle_tangent,fov_right_angle_tangent,fov_top_angle_tangent,fov_down_angle_tangent,"
-        "near_z,far_z,width,height\n"
-        f"{timestamp},0.001,"
-        "0.0,1.5,0.0,"
-        "0.0,0.0,0.0,1.0,"
-        "1.0,1.0,1.0,1.0,"
-        "0.1,10.0,256,256\n"
+    depth_csv.write_bytes(
+        DEPTH_DESCRIPTORS_HEADER
+        + f"{timestamp},0.001,0.0,1.5,0.0,0.0,0.0,0.0,1.0,1.0,1.0,1.0,1.0,0.1,10.0,256,256\n".encode()
     )
 
     # Create poses CSV
     poses_csv = session_dir / "poses.csv"
-    poses_csv.write_text(
-        "unix_time,ovr_timestamp,pos_x,pos_y,pos_z,rot_x,rot_y,rot_z,rot_w\n"
-        f"{timestamp - 10},0.0009,0.0,1.5,0.0,0.0,0.0,0.0,1.0\n"
-        f"{timestamp},0.001,0.0,1.5,0.1,0.0,0.0,0.0,1.0\n"
-        f"{timestamp + 10},0.0011,0.0,1.5,0.2,0.0,0.0,0.0,1.0\n"
+    poses_csv.write_bytes(
+        POSES_HEADER
+        + (
+            f"{timestamp - 10},0.0009,0.0,1.5,0.0,0.0,0.0,0.0,1.0\n"
+            f"{timestamp},0.001,0.0,1.5,0.1,0.0,0.0,0.0,1.0\n"
+            f"{timestamp + 10},0.0011,0.0,1.5,0.2,0.0,0.0,0.0,1.0\n"
+        ).encode()
     )
 
     return session_dir
@@ -123,18 +127,15 @@ class TestMockSessionStructure:
 
     def test_poses_csv_has_correct_columns(self, mock_quest_session: Path) -> None:
         """Poses CSV should have all required columns."""
-        import pandas as pd
-
-        df = pd.read_csv(mock_quest_session / "poses.csv")
+        header, *rows = (mock_quest_session / "poses.csv").read_text().splitlines()
         expected = ["unix_time", "ovr_timestamp", "pos_x", "pos_y", "pos_z",
                      "rot_x", "rot_y", "rot_z", "rot_w"]
-        assert list(df.columns) == expected
-        assert len(df) == 3
+        assert header.split(",") == expected
+        assert len(rows) == 3
 
     def test_depth_descriptors_csv_is_valid(self, mock_quest_session: Path) -> None:
         """Depth descriptors should have all 17 columns."""
-        import pandas as pd
-
-        df = pd.read_csv(mock_quest_session / "left_depth_descriptors.csv")
-        assert len(df.columns) == 17
-        assert len(df) == 1
+        header, *rows = (mock_quest_session / "left_depth_descriptors.csv").read_text().splitlines()
+        assert len(header.split(",")) == 17
+        assert len(rows) == 1
+        assert all(len(row.split(",")) == 17 for row in rows)